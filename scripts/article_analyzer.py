@@ -0,0 +1,438 @@
+import argparse
+import logging
+import re
+import sqlite3
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+# Set up logging
+data_dir = Path(__file__).resolve().parent.parent / "data"
+logs_dir = data_dir / "logs"
+logs_dir.mkdir(parents=True, exist_ok=True)
+log_file = logs_dir / "article_analyzer.log"
+
+logging.basicConfig(
+    filename=log_file,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+
+# Database path
+db_path = data_dir / "rss_collector.db"
+
+STOPWORDS = frozenset("""
+    a about after against all also an and are as at be been before but by
+    can could did do does for from had has have he her his how if in into
+    is it its more new no not now of on or our out over says she so than
+    that the their them there they this to up us was we were what when who
+    why will with would you your
+""".split())
+
+TERM_PATTERN = re.compile(r"[a-z0-9][a-z0-9'-]+")
+WORD_PATTERN = re.compile(r"[\w'.-]+")
+# A leading capitalised run longer than this is taken to be a Title Case headline
+MAX_LEADING_ENTITY_WORDS = 3
+
+
+class CountMinSketch:
+    """
+    A fixed-size frequency sketch. Estimates never undercount, and
+    overcount by at most e*N/width with probability 1 - e^(-depth), where N
+    is the total count added.
+    """
+
+    def __init__(self, width=2048, depth=4):
+        """
+        Args:
+            width (int): Counters per row.
+            depth (int): Number of independent hash rows.
+        """
+        self.width = width
+        self.depth = depth
+        self.rows = [[0] * width for _ in range(depth)]
+
+    def _indexes(self, item):
+        for seed in range(self.depth):
+            yield seed, hash((seed, item)) % self.width
+
+    def add(self, item, count=1):
+        for seed, index in self._indexes(item):
+            self.rows[seed][index] += count
+
+    def estimate(self, item):
+        return min(self.rows[seed][index] for seed, index in self._indexes(item))
+
+
+class SpaceSaving:
+    """
+    Top-k heavy hitters tracked in at most ``k`` counters (Space-Saving).
+    """
+
+    def __init__(self, k=50):
+        self.k = k
+        self.counts = {}
+
+    def add(self, item, count=1):
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.k:
+            self.counts[item] = count
+        else:
+            # Replace the smallest counter, inheriting its count as error
+            smallest = min(self.counts, key=self.counts.get)
+            self.counts[item] = self.counts.pop(smallest) + count
+
+    def top(self, n=10):
+        return sorted(self.counts.items(), key=lambda kv: kv[1], reverse=True)[:n]
+
+
+class SlidingWindowCounter:
+    """
+    Approximate term counts over a sliding time window.
+
+    The window is split into ``num_buckets`` consecutive buckets of
+    ``bucket_seconds`` each; every bucket holds its own Count-Min sketch and
+    heavy-hitter table. Advancing time appends one bucket per elapsed
+    interval (empty ones included) and drops the oldest, so the window always
+    spans ``num_buckets * bucket_seconds``. Memory is bounded by the bucket
+    count and sketch sizes, not by the corpus.
+    """
+
+    def __init__(self, num_buckets=24, bucket_seconds=3600, width=2048, depth=4, k=50):
+        self.num_buckets = num_buckets
+        self.bucket_seconds = bucket_seconds
+        self.width = width
+        self.depth = depth
+        self.k = k
+        self.buckets = deque(maxlen=num_buckets)
+
+    def _append_bucket(self, bucket_id):
+        self.buckets.append(
+            (bucket_id, CountMinSketch(self.width, self.depth), SpaceSaving(self.k))
+        )
+
+    def _bucket_for(self, timestamp):
+        """
+        Return the bucket covering ``timestamp``, advancing the window if it
+        is newer than the newest bucket, or None if it is older than the window.
+        """
+        bucket_id = int(timestamp // self.bucket_seconds)
+        if not self.buckets:
+            # Start with a full, empty window ending at the first row
+            for earlier in range(bucket_id - self.num_buckets + 1, bucket_id):
+                self._append_bucket(earlier)
+            self._append_bucket(bucket_id)
+        newest = self.buckets[-1][0]
+        if bucket_id > newest:
+            # Buckets stay consecutive; a gap longer than the window resets it
+            first = max(newest + 1, bucket_id - self.num_buckets + 1)
+            for missing in range(first, bucket_id + 1):
+                self._append_bucket(missing)
+        oldest = self.buckets[0][0]
+        if bucket_id < oldest:
+            return None
+        return self.buckets[bucket_id - oldest]
+
+    def add(self, item, timestamp):
+        """
+        Count ``item`` at ``timestamp``.
+
+        Returns:
+            tuple: ``(bucket_id, estimate)`` for the bucket the item landed
+            in, or None if ``timestamp`` is older than the window.
+        """
+        bucket = self._bucket_for(timestamp)
+        if bucket is None:
+            return None
+        bucket_id, sketch, heavy_hitters = bucket
+        sketch.add(item)
+        heavy_hitters.add(item)
+        return bucket_id, sketch.estimate(item)
+
+    def current_bucket_id(self):
+        return self.buckets[-1][0] if self.buckets else None
+
+    def baseline(self, item):
+        """
+        Return the mean estimated count of ``item`` over the previous buckets.
+        """
+        previous = list(self.buckets)[:-1]
+        if not previous:
+            return 0.0
+        return sum(sketch.estimate(item) for _, sketch, _ in previous) / len(previous)
+
+    def top(self, n=10):
+        """
+        Return the ``n`` heaviest items across the whole window.
+        """
+        candidates = set()
+        for _, _, heavy_hitters in self.buckets:
+            candidates.update(heavy_hitters.counts)
+        totals = {
+            item: sum(sketch.estimate(item) for _, sketch, _ in self.buckets)
+            for item in candidates
+        }
+        return sorted(totals.items(), key=lambda kv: kv[1], reverse=True)[:n]
+
+
+def extract_terms(title):
+    """
+    Return lowercase title words, without stopwords.
+    """
+    return [
+        term for term in TERM_PATTERN.findall(title.lower())
+        if term not in STOPWORDS and len(term) > 2
+    ]
+
+
+def extract_entities(title):
+    """
+    Return runs of capitalised words as a cheap stand-in for named entities.
+
+    Runs are split at stopwords and punctuation. A run covering the whole
+    title, or starting the title and spanning more than
+    MAX_LEADING_ENTITY_WORDS words, is a Title Case headline and is skipped.
+    """
+    words = []
+    for match in WORD_PATTERN.finditer(title):
+        word = match.group().strip("'-")
+        # Drop a sentence-ending period but keep abbreviations such as "U.S."
+        if word.endswith(".") and "." not in word[:-1]:
+            word = word[:-1]
+        if word:
+            words.append((match.start(), match.end(), word))
+    content_words = [word for _, _, word in words if word.lower() not in STOPWORDS]
+    # Index of the first word that is not a stopword, where the headline proper starts
+    title_start = next(
+        (index for index, (_, _, word) in enumerate(words) if word.lower() not in STOPWORDS), 0
+    )
+
+    runs = []
+    open_run = None
+    previous_end = None
+    for index, (start, end, word) in enumerate(words):
+        joined = previous_end is not None and not title[previous_end:start].strip()
+        if word[0].isupper() and word.lower() not in STOPWORDS:
+            if open_run is None or not joined:
+                open_run = (index, [])
+                runs.append(open_run)
+            open_run[1].append(word)
+        else:
+            open_run = None
+        previous_end = end
+
+    entities = []
+    for first_index, run in runs:
+        if len(run) == len(content_words):
+            continue
+        if first_index == title_start and len(run) > MAX_LEADING_ENTITY_WORDS:
+            continue
+        entity = " ".join(run)
+        if len(entity) > 1:
+            entities.append(entity)
+    return entities
+
+
+def parse_published(published):
+    """
+    Convert a feed date string to a UTC timestamp, or None if it cannot
+    be parsed.
+    """
+    if published:
+        for parse in (parsedate_to_datetime, datetime.fromisoformat):
+            try:
+                parsed = parse(published)
+            except (TypeError, ValueError, IndexError):
+                continue
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.timestamp()
+    return None
+
+
+class ArticleAnalyzer:
+    """
+    Streams articles into sliding-window sketches and flags bursting
+    title terms and entities.
+    """
+
+    def __init__(self, db_path=db_path, min_count=5, burst_ratio=3.0, **window_options):
+        """
+        Args:
+            db_path (Path): Path to the SQLite database.
+            min_count (int): Minimum count in the current bucket to flag a burst.
+            burst_ratio (float): How many times its baseline a count must reach.
+            **window_options: Passed to each SlidingWindowCounter.
+        """
+        self.db_path = db_path
+        self.min_count = min_count
+        self.burst_ratio = burst_ratio
+        self.windows = {
+            "term": SlidingWindowCounter(**window_options),
+            "entity": SlidingWindowCounter(**window_options),
+        }
+        self.flagged = set()
+        self.last_id = 0
+
+    def _observe(self, kind, item, timestamp):
+        window = self.windows[kind]
+        result = window.add(item, timestamp)
+        if result is None:
+            return None
+        bucket_id, count = result
+        # Late rows still count towards history but only the newest bucket bursts
+        if bucket_id != window.current_bucket_id() or count < self.min_count:
+            return None
+        key = (kind, item, window.current_bucket_id())
+        if key in self.flagged:
+            return None
+        baseline = window.baseline(item)
+        if count >= self.burst_ratio * (baseline + 1):
+            self.flagged.add(key)
+            return {"kind": kind, "item": item, "count": count, "baseline": baseline}
+        return None
+
+    def process(self, title, timestamp):
+        """
+        Count one article seen at ``timestamp`` and return any bursts it
+        triggered.
+        """
+        if not title:
+            return []
+        bucket_id = self.windows["term"].current_bucket_id()
+        bursts = []
+        for term in set(extract_terms(title)):
+            burst = self._observe("term", term, timestamp)
+            if burst:
+                bursts.append(burst)
+        for entity in set(extract_entities(title)):
+            burst = self._observe("entity", entity, timestamp)
+            if burst:
+                bursts.append(burst)
+        if bucket_id != self.windows["term"].current_bucket_id():
+            # Only flags for the current bucket can still fire again
+            current = self.windows["term"].current_bucket_id()
+            self.flagged = {key for key in self.flagged if key[2] == current}
+        return bursts
+
+    def _consume(self, cursor, batch_size=1000):
+        """
+        Process every article with an id above ``last_id``, timestamped at
+        ingestion since feeds publish late and out of order.
+        """
+        cursor.execute(
+            """
+            SELECT id, title
+            FROM articles
+            WHERE id > ?
+            ORDER BY id
+            """,
+            (self.last_id,),
+        )
+        processed = 0
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            now = time.time()
+            for id_, title in rows:
+                for burst in self.process(title, now):
+                    report_burst(burst)
+                self.last_id = id_
+            processed += len(rows)
+        return processed
+
+    def replay(self, batch_size=1000):
+        """
+        Process the stored history in published-time order.
+
+        SQLite does the sort (spilling to disk if needed), so memory stays
+        bounded. Articles whose date cannot be parsed are skipped.
+        """
+        processed = 0
+        with sqlite3.connect(self.db_path) as conn:
+            conn.create_function("parse_published", 1, parse_published, deterministic=True)
+            cursor = conn.cursor()
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM articles")
+            self.last_id = cursor.fetchone()[0]
+            cursor.execute(
+                """
+                SELECT title, ts FROM (
+                    SELECT title, parse_published(published) AS ts
+                    FROM articles
+                    WHERE id <= ?
+                )
+                WHERE ts IS NOT NULL
+                ORDER BY ts
+                """,
+                (self.last_id,),
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for title, timestamp in rows:
+                    for burst in self.process(title, timestamp):
+                        report_burst(burst)
+                processed += len(rows)
+        return processed
+
+    def run(self, poll_interval=30):
+        """
+        Follow the articles table, processing rows as the collector inserts them.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM articles")
+            self.last_id = cursor.fetchone()[0]
+            while True:
+                processed = self._consume(cursor)
+                if processed:
+                    logging.info(f"Analyzed {processed} new articles.")
+                time.sleep(poll_interval)
+
+
+def report_burst(burst):
+    message = (
+        f"Burst detected for {burst['kind']} '{burst['item']}': "
+        f"{burst['count']} in current bucket vs baseline {burst['baseline']:.1f}"
+    )
+    print(message)
+    logging.info(message)
+
+
+def print_top(analyzer, n=10):
+    for kind, window in analyzer.windows.items():
+        print(f"\nTop {kind} counts:")
+        for item, count in window.top(n):
+            print(f" - {item}: {count}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detect trending and bursting terms in articles.")
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Process the stored history instead of following new articles.",
+    )
+    parser.add_argument("--poll-interval", type=int, default=30, help="Seconds between polls.")
+    parser.add_argument("--min-count", type=int, default=5, help="Minimum count to flag a burst.")
+    parser.add_argument("--burst-ratio", type=float, default=3.0, help="Count-to-baseline ratio to flag a burst.")
+    args = parser.parse_args()
+
+    analyzer = ArticleAnalyzer(min_count=args.min_count, burst_ratio=args.burst_ratio)
+    if args.replay:
+        started = time.monotonic()
+        processed = analyzer.replay()
+        print(f"Replayed {processed} articles in {time.monotonic() - started:.2f}s.")
+        print_top(analyzer)
+    else:
+        print("Following new articles...")
+        try:
+            analyzer.run(poll_interval=args.poll_interval)
+        except KeyboardInterrupt:
+            print("\nArticle analyzer stopped.")
+            print_top(analyzer)
@@ -0,0 +1,15 @@
+from typing import NamedTuple
+
+
+class ArticleRecord(NamedTuple):
+    """
+    A single fetched article.
+
+    Field order matches the INSERT column list in ``save_new_articles``, so a
+    record can be used directly as the leading query parameters.
+    """
+
+    title: str
+    link: str
+    published: str
+    source: str
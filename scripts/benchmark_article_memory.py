@@ -0,0 +1,180 @@
+import argparse
+import logging
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import feedparser
+import requests
+
+import rss_helpers
+
+NUM_ENTRIES = 100_000
+NUM_FEEDS = 60
+
+
+class FakeResponse:
+    """
+    Stands in for ``requests.Response`` with a generated RSS body.
+    """
+
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+def build_feed_bodies(num_entries, num_feeds=NUM_FEEDS):
+    """
+    Return a mapping of feed URL to an RSS document, ``num_entries`` items in total.
+    """
+    bodies = {}
+    per_feed = num_entries // num_feeds
+    for feed in range(num_feeds):
+        items = "".join(
+            f"<item><title>Article headline number {feed}-{i} about world events</title>"
+            f"<link>https://example.com/news/{feed}/{i}/article-headline-number-{i}</link>"
+            f"<pubDate>Wed, 4 Dec 2024 {i % 24:02d}:{i % 60:02d}:00 +0000</pubDate></item>"
+            for i in range(per_feed + (1 if feed < num_entries % num_feeds else 0))
+        )
+        bodies[f"https://example.com/feed/{feed}.xml"] = (
+            f"<?xml version='1.0'?><rss version='2.0'><channel>"
+            f"<title>Example Feed {feed}</title>{items}</channel></rss>"
+        ).encode("utf-8")
+    return bodies
+
+
+def fetch_feed_with_dicts(url):
+    """
+    The previous fetch_feed: one dict per entry.
+    """
+    articles = []
+    try:
+        response = requests.get(url, timeout=10)
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
+        for entry in feed.entries:
+            articles.append(
+                {
+                    "title": entry.get("title", "No Title"),
+                    "link": entry.get("link", "No Link"),
+                    "published": entry.get("published", datetime.now().isoformat()),
+                    "source": feed.feed.get("title", "Unknown Source"),
+                }
+            )
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Error fetching feed {url}: {e}")
+    return articles
+
+
+def save_with_dicts(articles, feed_urls, db_path):
+    """
+    The previous save_new_articles: one execute and parameter tuple per article.
+    """
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        for article in articles:
+            content = rss_helpers.fetch_article_content(article["link"])
+            try:
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO articles (title, link, published, source, content)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        article["title"],
+                        article["link"],
+                        article["published"],
+                        article["source"],
+                        content,
+                    ),
+                )
+            except Exception as e:
+                logging.error(f"Error saving article: {article['title']}, Error: {e}")
+        for url in feed_urls:
+            cursor.execute("INSERT OR IGNORE INTO feeds (url) VALUES (?)", (url,))
+        conn.commit()
+
+
+def create_schema(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript("""
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            link TEXT UNIQUE,
+            published TEXT,
+            source TEXT,
+            content TEXT
+        );
+        CREATE TABLE feeds (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            url TEXT UNIQUE NOT NULL,
+            added_on DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+        """)
+
+
+def peak_rss_kb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_mode(mode, num_entries):
+    """
+    Run one fetch/save cycle through rss_helpers with the network, article
+    scraping and database logging mocked out, and print the peak RSS.
+    """
+    logging.disable(logging.CRITICAL)
+    bodies = build_feed_bodies(num_entries)
+    feed_urls = list(bodies)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "benchmark.db"
+        create_schema(db_path)
+        with mock.patch.object(
+            rss_helpers.requests, "get", lambda url, timeout: FakeResponse(bodies[url])
+        ), mock.patch.object(
+            rss_helpers, "fetch_article_content", return_value=None
+        ), mock.patch.object(rss_helpers, "log_to_database"):
+            baseline = peak_rss_kb()
+            if mode == "dicts":
+                with mock.patch.object(rss_helpers, "fetch_feed", fetch_feed_with_dicts):
+                    articles = rss_helpers.fetch_all_feeds(feed_urls)
+                save_with_dicts(articles, feed_urls, db_path)
+            else:
+                articles = rss_helpers.fetch_all_feeds(feed_urls)
+                rss_helpers.save_new_articles(articles, feed_urls, db_path=db_path)
+            peak = peak_rss_kb()
+
+    print(peak - baseline, peak, len(articles))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare peak RSS of an article fetch/save cycle.")
+    parser.add_argument("--entries", type=int, default=NUM_ENTRIES, help="Articles per cycle.")
+    parser.add_argument("--mode", choices=["dicts", "records"], help="Run a single mode in this process.")
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.entries)
+    else:
+        print(f"Peak RSS for a {args.entries}-entry cycle")
+        print("=================================")
+        # Each mode runs in a fresh process so peaks do not carry over
+        for mode in ("dicts", "records"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--entries", str(args.entries)],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split()
+            growth, peak, saved = (int(value) for value in output)
+            print(f" - {mode}: peak {peak / 1024:.1f} MiB (+{growth / 1024:.1f} MiB for {saved} articles)")
@@ -30,4 +30,80 @@ def initialize_database():
             message TEXT
         );
         """)
-        print("Database initialized successfully.")
\ No newline at end of file
+        print("Database initialized successfully.")
+    enable_wal_and_indexes()
+
+def enable_wal_and_indexes(db_path=db_path):
+    """
+    Switch the database to WAL mode and create the indexes used by readers.
+
+    WAL lets read-only connections (e.g. the query service) run alongside the
+    collector's writes, and the indexes keep dashboard queries off full scans.
+    """
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL;")
+        ensure_article_indexes(cursor)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs (timestamp)")
+        ensure_collector_meta(cursor)
+
+def ensure_article_indexes(cursor):
+    """
+    Create the articles indexes used by the query service and the integrity checks.
+    """
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_title ON articles (title)")
+
+def ensure_collector_meta(cursor):
+    """
+    Create the collector_meta table holding the article commit counter.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS collector_meta (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+def bump_commit_counter(cursor):
+    """
+    Increment the commit counter read by the query service's cache.
+
+    Call this inside the transaction that changes articles or feeds, so
+    unrelated commits (e.g. log rows) do not invalidate cached results.
+    """
+    ensure_collector_meta(cursor)
+    cursor.execute("""
+        INSERT INTO collector_meta (name, value) VALUES ('commit_counter', 1)
+        ON CONFLICT (name) DO UPDATE SET value = value + 1
+    """)
+
+def ensure_integrity_stats(cursor, names):
+    """
+    Create the integrity_stats table and a zeroed row for each of ``names``.
+
+    The table is shared: verify_data_validity and remove_duplicate_articles
+    each own their own rows in it.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS integrity_stats (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    cursor.executemany(
+        "INSERT OR IGNORE INTO integrity_stats (name, value) VALUES (?, 0)",
+        [(name,) for name in names],
+    )
+
+def read_commit_counter(cursor):
+    """
+    Return the current commit counter, or 0 if nothing has been recorded yet.
+    """
+    try:
+        cursor.execute("SELECT value FROM collector_meta WHERE name = 'commit_counter'")
+    except sqlite3.OperationalError:
+        # The table does not exist until the collector first writes
+        return 0
+    row = cursor.fetchone()
+    return row[0] if row else 0
\ No newline at end of file
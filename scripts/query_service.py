@@ -0,0 +1,310 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from queue import Queue
+from urllib.parse import parse_qs, urlparse
+
+from database_manager import enable_wal_and_indexes, read_commit_counter
+from verify_data_validity import STAT_NAMES
+
+# Define the database path
+db_path = Path(__file__).resolve().parent.parent / "data" / "rss_collector.db"
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+
+class ReadOnlyConnectionPool:
+    """
+    A fixed-size pool of read-only SQLite connections.
+
+    A dedicated connection reads the collector's commit counter, which only
+    changes when articles or feeds are written. ``PRAGMA data_version`` is
+    checked first so the counter row is only re-read after some commit.
+    """
+
+    def __init__(self, db_path, size=4):
+        """
+        Open ``size`` read-only connections to the database.
+
+        Args:
+            db_path (Path): Path to the SQLite database.
+            size (int): Number of pooled connections.
+        """
+        self.db_path = db_path
+        self._pool = Queue(maxsize=size)
+        for _ in range(size):
+            self._pool.put(self._connect())
+        self._version_conn = self._connect()
+        self._version_lock = threading.Lock()
+        self._data_version = None
+        self._commit_counter = 0
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        conn.execute("PRAGMA query_only=ON;")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection from the pool, returning it when done.
+        """
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def commit_counter(self):
+        """
+        Return the collector's current commit counter.
+        """
+        with self._version_lock:
+            cursor = self._version_conn.cursor()
+            data_version = cursor.execute("PRAGMA data_version;").fetchone()[0]
+            if data_version != self._data_version:
+                self._data_version = data_version
+                self._commit_counter = read_commit_counter(cursor)
+            return self._commit_counter
+
+    def close(self):
+        """
+        Close every pooled connection.
+        """
+        while not self._pool.empty():
+            self._pool.get().close()
+        self._version_conn.close()
+
+
+class ResultCache:
+    """
+    A TTL/LRU cache whose entries are only valid for the commit counter
+    they were computed at.
+    """
+
+    def __init__(self, max_entries=256, ttl=30.0):
+        """
+        Args:
+            max_entries (int): Maximum number of cached results.
+            ttl (float): Seconds before an entry expires regardless of version.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        """
+        Return the cached value for ``key`` or None if missing or stale.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry_version, expires_at, value = entry
+            if entry_version != version or expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, version, value):
+        """
+        Store ``value`` for ``key`` at the given commit counter.
+        """
+        with self._lock:
+            self._entries[key] = (version, time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def recent_articles(cursor, limit=20):
+    """
+    Return the most recently collected articles.
+    """
+    cursor.execute(
+        """
+        SELECT id, title, link, published, source
+        FROM articles
+        ORDER BY id DESC
+        LIMIT ?
+        """,
+        (limit,),
+    )
+    columns = ("id", "title", "link", "published", "source")
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def source_counts(cursor):
+    """
+    Return the number of articles stored for each source.
+    """
+    cursor.execute(
+        """
+        SELECT source, COUNT(*) AS cnt
+        FROM articles
+        GROUP BY source
+        ORDER BY cnt DESC
+        """
+    )
+    return [{"source": source, "count": count} for source, count in cursor.fetchall()]
+
+
+def search_articles(cursor, query, limit=20):
+    """
+    Return articles whose title contains ``query``.
+
+    ``%`` and ``_`` in ``query`` match literally. This scans every title, so
+    results rely on the cache.
+    """
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    cursor.execute(
+        """
+        SELECT id, title, link, published, source
+        FROM articles
+        WHERE title LIKE ? ESCAPE '\\'
+        ORDER BY id DESC
+        LIMIT ?
+        """,
+        (f"%{escaped}%", limit),
+    )
+    columns = ("id", "title", "link", "published", "source")
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def integrity_stats(cursor):
+    """
+    Return the running counters kept by verify_data_validity.
+
+    The articles table is not rescanned: the counters cover articles up to
+    ``last_checked_rowid``, and ``latest_article_id`` (a primary-key lookup)
+    shows how far the collector has got since.
+    """
+    stats = {name: 0 for name in STAT_NAMES}
+    try:
+        placeholders = ", ".join("?" for _ in STAT_NAMES)
+        cursor.execute(
+            f"SELECT name, value FROM integrity_stats WHERE name IN ({placeholders})",
+            STAT_NAMES,
+        )
+        stats.update(cursor.fetchall())
+    except sqlite3.OperationalError:
+        # verify_data_validity has not run against this database yet
+        pass
+    cursor.execute("SELECT MAX(id) FROM articles")
+    stats["latest_article_id"] = cursor.fetchone()[0] or 0
+    # feeds holds one row per configured URL, so counting it stays cheap
+    cursor.execute("SELECT COUNT(*) FROM feeds")
+    stats["total_feeds"] = cursor.fetchone()[0]
+    return stats
+
+
+class QueryService:
+    """
+    Runs dashboard queries through the connection pool and result cache.
+    """
+
+    def __init__(self, db_path=db_path, pool_size=4, cache_size=256, cache_ttl=30.0):
+        self.pool = ReadOnlyConnectionPool(db_path, size=pool_size)
+        self.cache = ResultCache(max_entries=cache_size, ttl=cache_ttl)
+
+    def query(self, name, func, *args):
+        """
+        Return ``func(cursor, *args)``, served from the cache when no
+        articles or feeds have been written since it was computed.
+        """
+        key = (name, args)
+        version = self.pool.commit_counter()
+        result = self.cache.get(key, version)
+        if result is None:
+            with self.pool.connection() as conn:
+                result = func(conn.cursor(), *args)
+            self.cache.put(key, version, result)
+        return result
+
+    def close(self):
+        self.pool.close()
+
+
+def _int_param(params, name, default, maximum=500):
+    try:
+        value = int(params.get(name, [default])[0])
+    except ValueError:
+        return default
+    return max(1, min(value, maximum))
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the JSON endpoints backed by the shared QueryService.
+    """
+
+    service = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        try:
+            if url.path == "/articles/recent":
+                limit = _int_param(params, "limit", 20)
+                body = self.service.query("recent", recent_articles, limit)
+            elif url.path == "/sources/counts":
+                body = self.service.query("sources", source_counts)
+            elif url.path == "/search":
+                query = params.get("q", [""])[0].strip()
+                if not query:
+                    self._send_json(400, {"error": "Missing query parameter 'q'."})
+                    return
+                limit = _int_param(params, "limit", 20)
+                body = self.service.query("search", search_articles, query, limit)
+            elif url.path == "/stats/integrity":
+                body = self.service.query("integrity", integrity_stats)
+            else:
+                self._send_json(404, {"error": f"Unknown endpoint: {url.path}"})
+                return
+        except sqlite3.Error as e:
+            self._send_json(500, {"error": f"Database error: {e}"})
+            return
+        self._send_json(200, body)
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_server(host=HOST, port=PORT, db_path=db_path):
+    """
+    Start the query service and block until interrupted.
+    """
+    enable_wal_and_indexes(db_path)
+    service = QueryService(db_path)
+    QueryRequestHandler.service = service
+    server = ThreadingHTTPServer((host, port), QueryRequestHandler)
+    print(f"Query service listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nQuery service stopped.")
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    run_server()
@@ -1,22 +1,85 @@
+import argparse
 import sqlite3
+import time
 from pathlib import Path
 
+from database_manager import bump_commit_counter, ensure_integrity_stats
+
 # Database path
 db_path = Path(__file__).resolve().parent.parent / "data" / "rss_collector.db"
 
-def remove_duplicate_articles():
-    with sqlite3.connect(db_path) as conn:
+def remove_duplicate_articles(db_path=db_path, full=False, batch_size=1000, max_batch_seconds=0.05, pause=0.1):
+    """
+    Remove articles whose link already exists on an earlier row.
+
+    Rows are processed in small rowid ranges, each in its own short
+    transaction, so the write lock is released between batches and the
+    collector can keep inserting. Only rows added since the last run are
+    scanned unless ``full`` is set.
+
+    Args:
+        db_path (Path): Path to the SQLite database.
+        full (bool): Rescan the whole table instead of resuming.
+        batch_size (int): Initial number of rowids per batch.
+        max_batch_seconds (float): Target duration of a batch; the batch size
+            is halved when a batch runs over and grown when it runs well under.
+        pause (float): Seconds to sleep between batches.
+
+    Returns:
+        int: Number of articles removed.
+    """
+    removed = 0
+    with sqlite3.connect(db_path, timeout=30) as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            DELETE FROM articles
-            WHERE rowid NOT IN (
-                SELECT MIN(rowid)
-                FROM articles
-                GROUP BY link
-            )
-        """)
+        ensure_integrity_stats(cursor, ("last_deduped_rowid",))
         conn.commit()
-        print("Duplicate articles removed.")
+
+        if full:
+            start = 0
+        else:
+            cursor.execute("SELECT value FROM integrity_stats WHERE name = 'last_deduped_rowid'")
+            start = cursor.fetchone()[0]
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM articles")
+        end = cursor.fetchone()[0]
+
+        while start < end:
+            stop = min(start + batch_size, end)
+            began = time.monotonic()
+            cursor.execute("""
+                DELETE FROM articles
+                WHERE id > ? AND id <= ?
+                AND EXISTS (
+                    SELECT 1 FROM articles AS earlier
+                    WHERE earlier.link = articles.link AND earlier.id < articles.id
+                )
+            """, (start, stop))
+            if cursor.rowcount > 0:
+                removed += cursor.rowcount
+                bump_commit_counter(cursor)
+            cursor.execute(
+                "UPDATE integrity_stats SET value = ? WHERE name = 'last_deduped_rowid'",
+                (stop,),
+            )
+            conn.commit()
+            elapsed = time.monotonic() - began
+
+            start = stop
+            if elapsed > max_batch_seconds:
+                batch_size = max(batch_size // 2, 50)
+            elif elapsed < max_batch_seconds / 4:
+                batch_size *= 2
+            if start < end:
+                time.sleep(pause)
+
+    print(f"Duplicate articles removed: {removed}.")
+    return removed
 
 if __name__ == "__main__":
-    remove_duplicate_articles()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Remove duplicate articles from the RSS database.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rescan every article instead of only those added since the last run.",
+    )
+    args = parser.parse_args()
+    remove_duplicate_articles(full=args.full)
@@ -3,11 +3,14 @@ import concurrent.futures
 from datetime import datetime
 import requests
 import logging
+import sys
 from pathlib import Path
 import sqlite3
 from queue import Queue
 import threading
 from newspaper import Article
+from article_record import ArticleRecord
+from database_manager import bump_commit_counter
 
 
 # Set up logging
@@ -25,6 +28,14 @@ logging.basicConfig(
 # File paths
 db_path = data_dir / "rss_collector.db"
 
+# Articles inserted per executemany in save_new_articles
+ARTICLE_CHUNK_SIZE = 200
+
+INSERT_ARTICLE_SQL = """
+    INSERT OR IGNORE INTO articles (title, link, published, source, content)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
 log_queue = Queue()
 
 
@@ -79,43 +90,54 @@ def fetch_article_content(url):
         article.parse()
         return article.text
     except Exception as e:
-        logging.error(f"Failed to fetch article content from {url}: {e}")
-        log_to_database("ERROR", f"Failed to fetch article content from {url}: {e}")
+        message = f"Failed to fetch article content from {url}: {e}"
+        logging.error(message)
+        log_to_database("ERROR", message)
         return None
     
 def fetch_feed(url):
     """
-    Fetch a single RSS feed and return its entries as a list of dictionaries.
+    Fetch a single RSS feed and return its entries as a list of ArticleRecords.
     """
     articles = []
     try:
         response = requests.get(url, timeout=10)  # Set timeout to 10 seconds
         response.raise_for_status()
         feed = feedparser.parse(response.content)
-        for entry in feed.entries:
-            articles.append(
-                {
-                    "title": entry.get("title", "No Title"),
-                    "link": entry.get("link", "No Link"),
-                    "published": entry.get("published", datetime.now().isoformat()),
-                    "source": feed.feed.get("title", "Unknown Source"),
-                }
+        # Shared by every entry; interned so repeated cycles reuse one string
+        source = sys.intern(feed.feed.get("title", "Unknown Source"))
+        fetched_at = datetime.now().isoformat()
+        articles = [
+            ArticleRecord(
+                entry.get("title", "No Title"),
+                entry.get("link", "No Link"),
+                entry.get("published", fetched_at),
+                source,
             )
-        logging.info(f"Fetched {len(articles)} articles from {url}.")
-        log_to_database("INFO", f"Fetched {len(articles)} articles from {url}.")
+            for entry in feed.entries
+        ]
+        message = f"Fetched {len(articles)} articles from {url}."
+        logging.info(message)
+        log_to_database("INFO", message)
     except requests.exceptions.RequestException as e:
-        logging.error(f"Error fetching feed {url}: {e}")
-        log_to_database("ERROR", f"Error fetching feed {url}: {e}")
+        message = f"Error fetching feed {url}: {e}"
+        logging.error(message)
+        log_to_database("ERROR", message)
     return articles
 
 
 def save_new_articles(articles, feed_urls, db_path=db_path):
     """
     Save new articles to the SQLite database and update feed URLs in the feeds table.
+
+    Articles are inserted in chunks of ARTICLE_CHUNK_SIZE with executemany,
+    each inside a savepoint. If a chunk fails, it is rolled back and retried
+    one row at a time, so only the rows that fail on their own are lost.
     """
     db_path.parent.mkdir(parents=True, exist_ok=True)  # Ensure the database directory exists
     with sqlite3.connect(db_path) as conn:
         cursor = conn.cursor()
+        changes_before = conn.total_changes
 
         # Ensure the articles table exists with a 'content' column
         cursor.execute(
@@ -131,55 +153,75 @@ def save_new_articles(articles, feed_urls, db_path=db_path):
             """
         )
 
-        # Save articles with content
-        for article in articles:
-            content = fetch_article_content(article["link"])
-            try:
-                cursor.execute(
-                    """
-                    INSERT OR IGNORE INTO articles (title, link, published, source, content)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (
-                        article["title"],
-                        article["link"],
-                        article["published"],
-                        article["source"],
-                        content,
-                    ),
-                )
-                if cursor.rowcount > 0:
-                    logging.info(f"New article added: {article['title']}")
-                    log_to_database("INFO", f"New article added: {article['title']}")
-                else:
-                    logging.info(f"Duplicate article skipped: {article['link']}")
-                    log_to_database("INFO", f"Duplicate article skipped: {article['link']}")
-            except Exception as e:
-                logging.error(f"Error saving article: {article['title']}, Error: {e}")
-                log_to_database("ERROR", f"Error saving article: {article['title']}, Error: {e}")
+        # Save articles with content; records are already in INSERT column order
+        added = 0
+        for offset in range(0, len(articles), ARTICLE_CHUNK_SIZE):
+            chunk = articles[offset:offset + ARTICLE_CHUNK_SIZE]
+            rows = [(*article, fetch_article_content(article.link)) for article in chunk]
+            added += insert_article_chunk(cursor, rows)
+        message = f"Saved {added} new articles, skipped or failed {len(articles) - added}."
+        logging.info(message)
+        log_to_database("INFO", message)
 
         # Save feed URLs to the feeds table
-        for url in feed_urls:
-            try:
-                cursor.execute(
-                    """
-                    INSERT OR IGNORE INTO feeds (url)
-                    VALUES (?)
-                    """,
-                    (url,),
-                )
-                logging.info(f"Feed URL added or already exists: {url}")
-                log_to_database("INFO", f"Feed URL added or already exists: {url}")
-            except sqlite3.IntegrityError:
-                logging.error(f"Error saving feed URL: {url}")
-                log_to_database("ERROR", f"Error saving feed URL: {url}")
-
+        try:
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO feeds (url)
+                VALUES (?)
+                """,
+                ((url,) for url in feed_urls),
+            )
+            message = f"Feed URLs added or already exist: {len(feed_urls)}"
+            logging.info(message)
+            log_to_database("INFO", message)
+        except sqlite3.IntegrityError as e:
+            message = f"Error saving feed URLs: {e}"
+            logging.error(message)
+            log_to_database("ERROR", message)
+
+        # Let the query service's cache know articles or feeds changed
+        if conn.total_changes > changes_before:
+            bump_commit_counter(cursor)
         conn.commit()
 
 
+def insert_article_chunk(cursor, rows):
+    """
+    Insert a chunk of article rows and return how many were added.
+
+    The chunk runs in a savepoint; if executemany fails, the savepoint is
+    rolled back and each row is inserted on its own, logging and skipping
+    any row that still fails.
+    """
+    cursor.execute("SAVEPOINT article_chunk")
+    try:
+        cursor.executemany(INSERT_ARTICLE_SQL, rows)
+        added = cursor.rowcount
+        cursor.execute("RELEASE article_chunk")
+        return added
+    except sqlite3.Error as e:
+        cursor.execute("ROLLBACK TO article_chunk")
+        cursor.execute("RELEASE article_chunk")
+        message = f"Error saving a chunk of {len(rows)} articles: {e}. Retrying row by row."
+        logging.warning(message)
+        log_to_database("WARNING", message)
+
+    added = 0
+    for row in rows:
+        try:
+            cursor.execute(INSERT_ARTICLE_SQL, row)
+            added += cursor.rowcount
+        except sqlite3.Error as e:
+            message = f"Error saving article: {row[1]}, Error: {e}"
+            logging.error(message)
+            log_to_database("ERROR", message)
+    return added
+
+
 def fetch_all_feeds(feed_urls):
     """
-    Fetch all RSS feeds in parallel and return a combined list of articles.
+    Fetch all RSS feeds in parallel and return a combined list of ArticleRecords.
     """
     articles = []
     with concurrent.futures.ThreadPoolExecutor() as executor:
@@ -188,9 +230,11 @@ def fetch_all_feeds(feed_urls):
             url = futures[future]
             try:
                 articles.extend(future.result())
-                logging.info(f"Successfully fetched feed: {url}")
-                log_to_database("INFO", f"Successfully fetched feed: {url}")
+                message = f"Successfully fetched feed: {url}"
+                logging.info(message)
+                log_to_database("INFO", message)
             except Exception as e:
-                logging.error(f"Error fetching feed {url}: {e}")
-                log_to_database("ERROR", f"Error fetching feed {url}: {e}")
+                message = f"Error fetching feed {url}: {e}"
+                logging.error(message)
+                log_to_database("ERROR", message)
     return articles
@@ -1,29 +1,133 @@
+import argparse
 import sqlite3
 from pathlib import Path
 from collections import Counter
 
+from database_manager import ensure_article_indexes, ensure_integrity_stats
+
 # Database path
 db_path = Path(__file__).resolve().parent.parent / "data" / "rss_collector.db"
 
-def verify_data_integrity():
+STAT_NAMES = (
+    "last_checked_rowid",
+    "checked_articles",
+    "duplicate_titles",
+    "incomplete_articles",
+)
+
+
+def ensure_stats_table(cursor):
+    """
+    Create the integrity_stats rows holding the running counters.
+    """
+    ensure_integrity_stats(cursor, STAT_NAMES)
+    ensure_article_indexes(cursor)
+
+
+def load_stats(cursor):
+    """
+    Return the running counters as a dict.
+
+    Only the STAT_NAMES rows are loaded; other rows in integrity_stats (such
+    as remove_duplicate_articles' progress) belong to other scripts.
+    """
+    placeholders = ", ".join("?" for _ in STAT_NAMES)
+    cursor.execute(
+        f"SELECT name, value FROM integrity_stats WHERE name IN ({placeholders})",
+        STAT_NAMES,
+    )
+    return dict(cursor.fetchall())
+
+
+def save_stats(cursor, stats):
+    cursor.executemany(
+        "UPDATE integrity_stats SET value = ? WHERE name = ?",
+        [(stats[name], name) for name in STAT_NAMES],
+    )
+
+
+def verify_new_articles(db_path=db_path, batch_size=500):
+    """
+    Check only the articles inserted since the last run.
+
+    Each new row is checked for missing fields, and each batch's titles are
+    counted against earlier rows in one indexed lookup. A title is counted as
+    duplicated the first time a second copy appears; NULL titles are never
+    duplicates, matching verify_data_integrity. Progress is committed after
+    every batch.
+
+    Returns:
+        dict: The updated running counters.
+    """
+    with sqlite3.connect(db_path, timeout=30) as conn:
+        cursor = conn.cursor()
+        ensure_stats_table(cursor)
+        conn.commit()
+        stats = load_stats(cursor)
+
+        while True:
+            cursor.execute("""
+                SELECT id, title, link, source
+                FROM articles
+                WHERE id > ?
+                ORDER BY id
+                LIMIT ?
+            """, (stats["last_checked_rowid"], batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            for id_, title, link, source in rows:
+                if title is None or link is None or source is None:
+                    stats["incomplete_articles"] += 1
+            stats["checked_articles"] += len(rows)
+
+            batch_titles = Counter(row[1] for row in rows if row[1] is not None)
+            if batch_titles:
+                placeholders = ", ".join("?" for _ in batch_titles)
+                cursor.execute(f"""
+                    SELECT title, COUNT(*)
+                    FROM articles
+                    WHERE id <= ? AND title IN ({placeholders})
+                    GROUP BY title
+                """, (stats["last_checked_rowid"], *batch_titles))
+                earlier = dict(cursor.fetchall())
+                for title, count in batch_titles.items():
+                    if earlier.get(title, 0) < 2 <= earlier.get(title, 0) + count:
+                        stats["duplicate_titles"] += 1
+
+            stats["last_checked_rowid"] = rows[-1][0]
+            save_stats(cursor, stats)
+            conn.commit()
+
+    return stats
+
+
+def verify_data_integrity(db_path=db_path):
     with sqlite3.connect(db_path) as conn:
         cursor = conn.cursor()
 
+        # Bound every check by the rows present now, so rows inserted while
+        # the audit runs are left for verify_new_articles
+        cursor.execute("SELECT COALESCE(MAX(id), 0), COUNT(*) FROM articles")
+        last_rowid, total_articles = cursor.fetchone()
+
         # Check for duplicate articles
         cursor.execute("""
             SELECT title, COUNT(*) AS cnt
             FROM articles
+            WHERE id <= ? AND title IS NOT NULL
             GROUP BY title
             HAVING cnt > 1
-        """)
+        """, (last_rowid,))
         duplicates = cursor.fetchall()
 
         # Check for missing data in articles
         cursor.execute("""
             SELECT id, title, link, source
             FROM articles
-            WHERE title IS NULL OR link IS NULL OR source IS NULL
-        """)
+            WHERE id <= ? AND (title IS NULL OR link IS NULL OR source IS NULL)
+        """, (last_rowid,))
         incomplete_articles = cursor.fetchall()
 
         # Check for duplicate feeds
@@ -35,6 +139,16 @@ def verify_data_integrity():
         """)
         duplicate_feeds = cursor.fetchall()
 
+        # Resynchronise the running counters used by verify_new_articles
+        ensure_stats_table(cursor)
+        save_stats(cursor, {
+            "last_checked_rowid": last_rowid,
+            "checked_articles": total_articles,
+            "duplicate_titles": len(duplicates),
+            "incomplete_articles": len(incomplete_articles),
+        })
+        conn.commit()
+
         # Output results
         print("Data Integrity Report")
         print("======================")
@@ -57,4 +171,20 @@ def verify_data_integrity():
                 print(f" - {url} (count: {count})")
 
 if __name__ == "__main__":
-    verify_data_integrity()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Verify data integrity of the RSS database.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Audit every row and reset the running counters.",
+    )
+    args = parser.parse_args()
+
+    if args.full:
+        verify_data_integrity()
+    else:
+        stats = verify_new_articles()
+        print("Incremental Data Integrity Report")
+        print("=================================")
+        print(f"Articles checked: {stats['checked_articles']} (up to ID {stats['last_checked_rowid']})")
+        print(f"Total duplicate articles: {stats['duplicate_titles']}")
+        print(f"Total incomplete articles: {stats['incomplete_articles']}")
\ No newline at end of file
@@ -0,0 +1,103 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from article_analyzer import (  # noqa: E402
+    ArticleAnalyzer,
+    CountMinSketch,
+    SlidingWindowCounter,
+    SpaceSaving,
+    extract_entities,
+    parse_published,
+)
+
+HOUR = 3600
+
+
+def test_count_min_sketch_never_undercounts():
+    sketch = CountMinSketch(width=16, depth=3)
+    for i in range(100):
+        sketch.add(f"term{i % 10}")
+    sketch.add("rare")
+    assert all(sketch.estimate(f"term{i}") >= 10 for i in range(10))
+    assert sketch.estimate("rare") >= 1
+
+
+def test_space_saving_replaces_smallest_counter():
+    heavy_hitters = SpaceSaving(k=2)
+    heavy_hitters.add("a", 5)
+    heavy_hitters.add("b", 2)
+    heavy_hitters.add("c")
+    assert heavy_hitters.counts == {"a": 5, "c": 3}
+    assert heavy_hitters.top(1) == [("a", 5)]
+
+
+def test_window_counts_empty_buckets_across_a_gap():
+    window = SlidingWindowCounter(num_buckets=4, bucket_seconds=HOUR, width=64)
+    window.add("x", 0)
+    assert [bucket_id for bucket_id, _, _ in window.buckets] == [-3, -2, -1, 0]
+    window.add("x", 2 * HOUR)
+    assert [bucket_id for bucket_id, _, _ in window.buckets] == [-1, 0, 1, 2]
+    assert window.baseline("x") == 1 / 3
+
+
+def test_window_evicts_buckets_older_than_the_window():
+    window = SlidingWindowCounter(num_buckets=3, bucket_seconds=HOUR, width=64)
+    window.add("x", 0)
+    window.add("x", 10 * HOUR)
+    assert [bucket_id for bucket_id, _, _ in window.buckets] == [8, 9, 10]
+    assert window.baseline("x") == 0
+    assert window.top() == [("x", 1)]
+
+
+def test_window_places_out_of_order_rows_in_their_own_bucket():
+    window = SlidingWindowCounter(num_buckets=3, bucket_seconds=HOUR, width=64)
+    window.add("x", 5 * HOUR)
+    assert window.add("x", 4 * HOUR) == (4, 1)
+    assert window.add("x", 5 * HOUR + 10) == (5, 2)
+    # Older than the window: dropped rather than folded into the newest bucket
+    assert window.add("x", 0) is None
+    assert window.baseline("x") == 0.5
+    assert window.top() == [("x", 3)]
+
+
+def test_burst_fires_once_per_bucket():
+    analyzer = ArticleAnalyzer(
+        db_path=None, min_count=3, burst_ratio=2.0, num_buckets=4, bucket_seconds=HOUR, width=256
+    )
+    fired = []
+    for i in range(6):
+        fired.extend(b for b in analyzer.process("Quake hits", 10 * HOUR + i) if b["item"] == "quake")
+    assert [b["count"] for b in fired] == [3]
+
+    fired = []
+    for i in range(6):
+        fired.extend(b for b in analyzer.process("Quake hits", 11 * HOUR + i) if b["item"] == "quake")
+    # The previous bucket's 6 raise the baseline, so the new bucket needs more
+    assert [b["count"] for b in fired] == [6]
+
+
+def test_late_rows_do_not_trigger_bursts():
+    analyzer = ArticleAnalyzer(
+        db_path=None, min_count=1, burst_ratio=1.0, num_buckets=4, bucket_seconds=HOUR, width=256
+    )
+    analyzer.process("Other news", 5 * HOUR)
+    assert analyzer.process("Quake hits", 4 * HOUR) == []
+
+
+def test_extract_entities_skips_title_case_headlines():
+    assert extract_entities("Biden Administration Weighs Putting Up Roadblocks") == ["Roadblocks"]
+    assert extract_entities("Markets Rally Again") == []
+
+
+def test_extract_entities_splits_runs_at_stopwords_and_punctuation():
+    assert extract_entities("The Fed holds rates as Jerome Powell warns") == ["Fed", "Jerome Powell"]
+    assert extract_entities("Trump: Biden responds to the U.S. Senate") == ["Trump", "Biden", "U.S. Senate"]
+
+
+def test_parse_published_handles_feed_formats():
+    assert parse_published("Wed, 4 Dec 2024 14:48:00 +0100") == 1733320080.0
+    assert parse_published("2024-12-04T13:48:00+00:00") == 1733320080.0
+    assert parse_published("not a date") is None
+    assert parse_published(None) is None
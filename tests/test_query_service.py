@@ -0,0 +1,115 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import query_service  # noqa: E402
+from database_manager import bump_commit_counter, enable_wal_and_indexes  # noqa: E402
+from query_service import QueryService, integrity_stats, search_articles  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "rss_collector.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript("""
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            link TEXT UNIQUE,
+            published TEXT,
+            source TEXT,
+            content TEXT
+        );
+        CREATE TABLE feeds (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            url TEXT UNIQUE NOT NULL,
+            added_on DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            level TEXT NOT NULL,
+            message TEXT
+        );
+        INSERT INTO articles (title, link, source) VALUES ('100% growth', 'a', 's');
+        INSERT INTO articles (title, link, source) VALUES ('snake_case news', 'b', 's');
+        INSERT INTO articles (title, link, source) VALUES ('Plain headline', 'c', 's');
+        INSERT INTO feeds (url) VALUES ('https://example.com/rss');
+        """)
+    enable_wal_and_indexes(path)
+    return path
+
+
+@pytest.fixture
+def service(db):
+    service = QueryService(db, pool_size=1)
+    yield service
+    service.close()
+
+
+def counting_query():
+    calls = []
+
+    def func(cursor):
+        calls.append(1)
+        return len(calls)
+
+    return func, calls
+
+
+def test_log_commits_keep_cached_results(db, service):
+    func, calls = counting_query()
+    service.query("count", func)
+    with sqlite3.connect(db) as conn:
+        conn.execute("INSERT INTO logs (level, message) VALUES ('INFO', 'Fetching RSS feeds...')")
+    service.query("count", func)
+    assert len(calls) == 1
+
+
+def test_commit_counter_invalidates_cache(db, service):
+    func, calls = counting_query()
+    service.query("count", func)
+    with sqlite3.connect(db) as conn:
+        bump_commit_counter(conn.cursor())
+    assert service.query("count", func) == 2
+
+
+def test_ttl_expires_cached_results(service, monkeypatch):
+    func, calls = counting_query()
+    now = [1000.0]
+    monkeypatch.setattr(query_service.time, "monotonic", lambda: now[0])
+    service.query("count", func)
+    now[0] += service.cache.ttl - 1
+    service.query("count", func)
+    assert len(calls) == 1
+    now[0] += 2
+    service.query("count", func)
+    assert len(calls) == 2
+
+
+def test_search_matches_wildcards_literally(db):
+    with sqlite3.connect(db) as conn:
+        cursor = conn.cursor()
+        assert [a["link"] for a in search_articles(cursor, "%")] == ["a"]
+        assert [a["link"] for a in search_articles(cursor, "_")] == ["b"]
+        assert [a["link"] for a in search_articles(cursor, "head")] == ["c"]
+
+
+def test_integrity_stats_reads_running_counters(db):
+    with sqlite3.connect(db) as conn:
+        cursor = conn.cursor()
+        assert integrity_stats(cursor)["checked_articles"] == 0
+        cursor.executescript("""
+        CREATE TABLE integrity_stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL DEFAULT 0);
+        INSERT INTO integrity_stats VALUES ('checked_articles', 2), ('last_checked_rowid', 2),
+            ('duplicate_titles', 1), ('incomplete_articles', 0);
+        """)
+        stats = integrity_stats(cursor)
+    assert stats["checked_articles"] == 2
+    assert stats["duplicate_titles"] == 1
+    assert stats["latest_article_id"] == 3
+    assert stats["total_feeds"] == 1
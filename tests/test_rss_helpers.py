@@ -0,0 +1,46 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+pytest.importorskip("feedparser")
+pytest.importorskip("newspaper")
+
+import rss_helpers  # noqa: E402
+from article_record import ArticleRecord  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    path = tmp_path / "rss_collector.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE feeds (id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT UNIQUE NOT NULL)")
+    monkeypatch.setattr(rss_helpers, "log_to_database", lambda level, message: None)
+    monkeypatch.setattr(rss_helpers, "fetch_article_content", lambda url: None)
+    monkeypatch.setattr(rss_helpers, "ARTICLE_CHUNK_SIZE", 2)
+    return path
+
+
+def saved_links(db):
+    with sqlite3.connect(db) as conn:
+        return [row[0] for row in conn.execute("SELECT link FROM articles ORDER BY id")]
+
+
+def test_bad_row_only_loses_itself(db):
+    articles = [
+        ArticleRecord("One", "l1", "p", "s"),
+        ArticleRecord("Bad", object(), "p", "s"),
+        ArticleRecord("Three", "l3", "p", "s"),
+        ArticleRecord("One again", "l1", "p", "s"),
+        ArticleRecord("Five", "l5", "p", "s"),
+    ]
+    rss_helpers.save_new_articles(articles, ["https://example.com/rss"], db_path=db)
+    assert saved_links(db) == ["l1", "l3", "l5"]
+
+
+def test_empty_cycle_saves_nothing(db):
+    rss_helpers.save_new_articles([], [], db_path=db)
+    assert saved_links(db) == []
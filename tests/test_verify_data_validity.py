@@ -0,0 +1,94 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from remove_duplicate_articles import remove_duplicate_articles  # noqa: E402
+from verify_data_validity import (  # noqa: E402
+    STAT_NAMES,
+    verify_data_integrity,
+    verify_new_articles,
+)
+
+ARTICLES = [
+    ("Same story", "a1", "s"),
+    ("Other story", "a2", "s"),
+    (None, "a3", "s"),
+    ("Same story", "a4", "s"),
+    (None, "a5", "s"),
+    ("Same story", "a6", None),
+    ("Third story", "a7", "s"),
+    ("Other story", "a8", "s"),
+    ("Third story", "a9", "s"),
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "rss_collector.db"
+    with sqlite3.connect(path) as conn:
+        # No UNIQUE on link, as in databases created before it was added
+        conn.executescript("""
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            link TEXT,
+            published TEXT,
+            source TEXT,
+            content TEXT
+        );
+        CREATE TABLE feeds (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            url TEXT NOT NULL
+        );
+        """)
+    return path
+
+
+def insert(db, rows):
+    with sqlite3.connect(db) as conn:
+        conn.executemany("INSERT INTO articles (title, link, source) VALUES (?, ?, ?)", rows)
+
+
+def read_stats(db):
+    with sqlite3.connect(db) as conn:
+        return dict(conn.execute("SELECT name, value FROM integrity_stats").fetchall())
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 500])
+def test_incremental_counters_match_full_audit(db, batch_size, capsys):
+    insert(db, ARTICLES[:4])
+    verify_new_articles(db, batch_size=batch_size)
+    insert(db, ARTICLES[4:])
+    incremental = verify_new_articles(db, batch_size=batch_size)
+
+    verify_data_integrity(db)
+    full = read_stats(db)
+    assert incremental == {name: full[name] for name in STAT_NAMES}
+    assert full["duplicate_titles"] == 3
+    assert full["incomplete_articles"] == 3
+    assert full["checked_articles"] == len(ARTICLES)
+
+
+def test_dedup_resumes_from_last_deduped_rowid(db, capsys):
+    insert(db, [("One", "l1", "s"), ("One again", "l1", "s"), ("Two", "l2", "s")])
+    assert remove_duplicate_articles(db, pause=0) == 1
+    verify_new_articles(db)
+    assert read_stats(db)["last_deduped_rowid"] == 3
+
+    # A duplicate behind the resume point is left for a full run
+    with sqlite3.connect(db) as conn:
+        conn.execute("INSERT INTO articles (id, title, link, source) VALUES (2, 'Two early', 'l2', 's')")
+    insert(db, [("Three", "l3", "s"), ("Three again", "l3", "s")])
+    assert remove_duplicate_articles(db, pause=0) == 1
+    stats = read_stats(db)
+    assert stats["last_deduped_rowid"] == 5
+    assert stats["last_checked_rowid"] == 3
+
+    assert remove_duplicate_articles(db, full=True, pause=0) == 1
+    with sqlite3.connect(db) as conn:
+        ids = [row[0] for row in conn.execute("SELECT id FROM articles ORDER BY id")]
+    assert ids == [1, 2, 4]